@@ -15,6 +15,7 @@ class BinanceWebSocketClient:
         self.ws = None
         self.running = False
         self.thread = None
+        self.connected = threading.Event()  # Set while the socket is open
         
         # Price tracking for pump detection
         self.price_history = defaultdict(lambda: deque(maxlen=5))
@@ -95,6 +96,7 @@ class BinanceWebSocketClient:
     def on_close(self, ws, close_status_code, close_msg):
         """Handle WebSocket close"""
         self.logger.warning("WebSocket connection closed")
+        self.connected.clear()
         if self.running:
             self.reconnect()
     
@@ -102,6 +104,7 @@ class BinanceWebSocketClient:
         """Handle WebSocket open"""
         self.logger.info("WebSocket connection opened")
         self.reconnect_delay = 1  # Reset reconnect delay on successful connection
+        self.connected.set()
     
     def reconnect(self):
         """Reconnect with exponential backoff"""
@@ -150,12 +153,17 @@ class BinanceWebSocketClient:
     def stop(self):
         """Stop WebSocket client"""
         self.running = False
+        self.connected.clear()
         if self.ws:
             self.ws.close()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
         self.logger.info("WebSocket client stopped")
     
+    def wait_until_connected(self, timeout=None):
+        """Block until the socket is open or timeout seconds pass; returns whether it connected"""
+        return self.connected.wait(timeout)
+    
     def is_running(self):
         """Check if client is running"""
         return self.running and self.thread and self.thread.is_alive()
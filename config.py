@@ -61,12 +61,22 @@ PRICES_FILE = f'{DATA_DIR}/prices.json'
 NEWS_FILE = f'{DATA_DIR}/news.json'
 SIGNALS_FILE = f'{DATA_DIR}/signals.json'
 LOG_FILE = f'{DATA_DIR}/system.log'
+ACTIVE_CHATS_DB = f'{DATA_DIR}/active_chats.db'
 
 # AI Model Settings
 AI_TIMEOUT = 30  # seconds
 AI_MAX_RETRIES = 3
 USE_AI_FALLBACK = True
 
+# Exact-match cache of model responses, for repeated identical runs (tests, local development)
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', '').strip().lower() in ('1', 'true', 'yes')
+LLM_CACHE_FILE = f'{DATA_DIR}/llm_cache.db'
+LLM_CACHE_TTL = 86400  # seconds
+
+# Offline mode (CI): no model calls; daily analysis uses the rule-based fallback, macro analysis the committed fixture
+LLM_OFFLINE = os.getenv('CAI_OFFLINE', '').strip().lower() in ('1', 'true', 'yes')
+LLM_OFFLINE_MACRO_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'macro.json')
+
 # Risk Management
 POSITION_SIZE = 0.1  # 10% of portfolio per trade
 STOP_LOSS_PCT = 0.02  # 2% stop loss
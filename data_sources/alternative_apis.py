@@ -11,11 +11,15 @@ from datetime import datetime
 import json
 
 class AlternativeAPIs:
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.logger = logging.getLogger(__name__)
-        self.session = None
+        # A caller-provided session is reused and left open on exit
+        self.session = session
+        self._owns_session = session is None
         
     async def __aenter__(self):
+        if not self._owns_session:
+            return self
         timeout = aiohttp.ClientTimeout(total=15, connect=5)
         self.session = aiohttp.ClientSession(
             timeout=timeout,
@@ -24,7 +28,7 @@ class AlternativeAPIs:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     async def get_coincap_data(self, symbols: List[str]) -> Dict:
@@ -270,15 +274,16 @@ class AlternativeAPIs:
         try:
             self.logger.info("🔄 Trying all alternative APIs...")
             
-            # Try APIs in parallel for speed
-            tasks = [
-                self.get_coincap_data(symbols),
-                self.get_kraken_data(symbols),
-                self.get_kucoin_data(symbols),
-                self.get_bybit_data(symbols)
-            ]
+            # Try APIs in parallel for speed; each getter logs its own failure and returns {}
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self.get_coincap_data(symbols)),
+                    tg.create_task(self.get_kraken_data(symbols)),
+                    tg.create_task(self.get_kucoin_data(symbols)),
+                    tg.create_task(self.get_bybit_data(symbols))
+                ]
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = [task.result() for task in tasks]
             
             # Combine results, preferring more complete datasets
             combined_result = {}
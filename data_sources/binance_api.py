@@ -16,7 +16,7 @@ import socket
 
 
 class BinanceAPI:
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.logger = logging.getLogger(__name__)
         self.base_url = "https://api.binance.com/api/v3"
         self.backup_urls = [
@@ -24,12 +24,17 @@ class BinanceAPI:
             "https://api2.binance.com/api/v3",
             "https://api3.binance.com/api/v3"
         ]
-        self.session = None
+        # A caller-provided session is reused and left open on exit
+        self.session = session
+        self._owns_session = session is None
         self.current_url = self.base_url
         self.max_retries = 3
         self.request_delay = 0.1  # Rate limiting delay
         
     async def __aenter__(self):
+        if not self._owns_session:
+            return self
+            
         # Create SSL context with better security settings
         ssl_context = ssl.create_default_context()
         # Only disable SSL verification if absolutely necessary
@@ -79,7 +84,7 @@ class BinanceAPI:
                 return False
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
             # Give time for connections to close properly
             await asyncio.sleep(0.1)
@@ -12,7 +12,7 @@ import config
 
 
 class CoinGeckoAPI:
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.logger = logging.getLogger(__name__)
         
         # Check if Pro API is available
@@ -26,7 +26,17 @@ class CoinGeckoAPI:
             self.base_url = "https://api.coingecko.com/api/v3"
             self.logger.info("🆓 Using CoinGecko Free API (limited)")
             
-        self.session = None
+        # A caller-provided session is reused and left open on exit
+        self.session = session
+        self._owns_session = session is None
+        
+        self.headers = {
+            'User-Agent': 'crypto-ai-analyzer/1.0',
+            'Accept': 'application/json'
+        }
+        # Add API key for Pro API
+        if self.pro_enabled and self.api_key:
+            self.headers['x-cg-pro-api-key'] = self.api_key
         
         # Symbol mapping from Binance format to CoinGecko IDs - Updated for production
         self.symbol_mapping = {
@@ -46,23 +56,16 @@ class CoinGeckoAPI:
         }
         
     async def __aenter__(self):
+        if not self._owns_session:
+            return self
+            
         # Add timeout and headers for better API handling
         timeout = aiohttp.ClientTimeout(total=15, connect=5)
-        headers = {
-            'User-Agent': 'crypto-ai-analyzer/1.0',
-            'Accept': 'application/json'
-        }
-        
-        # Add API key for Pro API
-        if self.pro_enabled and self.api_key:
-            headers['x-cg-pro-api-key'] = self.api_key
-            self.logger.debug("🔐 Added Pro API authentication header")
-            
-        self.session = aiohttp.ClientSession(timeout=timeout, headers=headers)
+        self.session = aiohttp.ClientSession(timeout=timeout, headers=self.headers)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
             await asyncio.sleep(0.1)  # Small delay for cleanup
             
@@ -95,7 +98,7 @@ class CoinGeckoAPI:
                 try:
                     self.logger.debug(f"CoinGecko request attempt {attempt + 1}/{max_attempts}")
                     
-                    async with self.session.get(endpoint, params=params) as response:
+                    async with self.session.get(endpoint, params=params, headers=self.headers) as response:
                         if response.status == 200:
                             data = await response.json()
                             
@@ -207,7 +210,7 @@ class CoinGeckoAPI:
             self.logger.info(f"🔄 Fetching data for {len(coin_ids)} coins from CoinGecko Simple API")
             self.logger.info(f"🔄 URL: {url}")
             
-            async with self.session.get(url, timeout=15) as response:
+            async with self.session.get(url, timeout=15, headers=self.headers) as response:
                 if response.status == 200:
                     data = await response.json()
                     self.logger.info(f"🔄 Response: {data}")
@@ -248,7 +251,7 @@ class CoinGeckoAPI:
         try:
             endpoint = f"{self.base_url}/search/trending"
             
-            async with self.session.get(endpoint) as response:
+            async with self.session.get(endpoint, headers=self.headers) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data.get('coins', [])
@@ -265,7 +268,7 @@ class CoinGeckoAPI:
         try:
             endpoint = f"{self.base_url}/ping"
             
-            async with self.session.get(endpoint) as response:
+            async with self.session.get(endpoint, headers=self.headers) as response:
                 return response.status == 200
                 
         except Exception as e:
@@ -19,9 +19,14 @@ except ImportError:
 
 
 class DataManager:
-    def __init__(self):
+    def __init__(self, session=None):
         self.logger = logging.getLogger(__name__)
         self.cache = {}
+        
+        # Optional shared aiohttp session reused by every data source call.
+        # aiohttp sessions belong to one event loop, so it is only used there.
+        self.session = session
+        self._session_loop = None
         self.cache_duration = 60  # Cache data for 60 seconds
         
         # Adjust CoinGecko cache duration based on Pro API availability
@@ -35,20 +40,44 @@ class DataManager:
             
         self.preferred_source = 'binance'  # Primary data source
         
-    async def get_market_data(self, symbols: List[str], force_refresh: bool = False) -> Dict:
+    def set_session(self, session):
+        """Share an aiohttp session owned by the caller's running event loop."""
+        self.session = session
+        self._session_loop = asyncio.get_running_loop() if session else None
+        
+    def _shared_session(self):
+        """Return the shared session if it can be used from the running loop."""
+        if self.session is None or self.session.closed:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._session_loop is None:
+            self._session_loop = loop
+        return self.session if self._session_loop is loop else None
+        
+    async def get_market_data(self, symbols: List[str], force_refresh: bool = False,
+                              max_age_seconds: Optional[float] = None) -> Dict:
         """Get market data from live sources ONLY - NO FALLBACK DATA EVER."""
         try:
+            # Live data fetched within max_age_seconds (default: cache_duration) is reused
+            if not force_refresh:
+                max_age = self.cache_duration if max_age_seconds is None else max_age_seconds
+                cached_entry = self.cache.get(self._market_cache_key(symbols))
+                if cached_entry and (datetime.utcnow() - cached_entry['timestamp']).total_seconds() < max_age:
+                    self.logger.info(f"📦 Using cached LIVE data for {len(cached_entry['data'])} symbols")
+                    return cached_entry['data']
+            
             self.logger.info("🔄 Fetching LIVE data from multiple sources...")
             
             # Try CoinGecko Simple API first (working and reliable)
             self.logger.info("🔄 Trying CoinGecko Simple API...")
             try:
                 from .coingecko_api import CoinGeckoAPI
-                async with CoinGeckoAPI() as coingecko:
+                async with CoinGeckoAPI(session=self._shared_session()) as coingecko:
                     coingecko_data = await coingecko.get_market_data(symbols)
                     
                     if coingecko_data and len(coingecko_data) >= len(symbols) * 0.8:  # At least 80% success
                         self.logger.info(f"✅ CoinGecko Simple API success: {len(coingecko_data)}/{len(symbols)} symbols")
+                        self._store_market_data(symbols, coingecko_data)
                         return coingecko_data
             except Exception as e:
                 self.logger.warning(f"CoinGecko Simple API failed: {e}")
@@ -57,11 +86,12 @@ class DataManager:
             self.logger.info("🔄 Trying Binance API...")
             try:
                 from .binance_api import BinanceAPI
-                async with BinanceAPI() as binance:
+                async with BinanceAPI(session=self._shared_session()) as binance:
                     binance_data = await binance.get_market_data(symbols)
                     
                     if binance_data and len(binance_data) >= len(symbols) * 0.8:  # At least 80% success
                         self.logger.info(f"✅ Binance API success: {len(binance_data)}/{len(symbols)} symbols")
+                        self._store_market_data(symbols, binance_data)
                         return binance_data
             except Exception as e:
                 self.logger.warning(f"Binance API failed: {e}")
@@ -70,11 +100,12 @@ class DataManager:
             self.logger.info("🔄 Trying Alternative APIs...")
             try:
                 from .alternative_apis import AlternativeAPIs
-                async with AlternativeAPIs() as alt_apis:
+                async with AlternativeAPIs(session=self._shared_session()) as alt_apis:
                     alt_data = await alt_apis.get_all_alternative_data(symbols)
                     
                     if alt_data and len(alt_data) >= len(symbols) * 0.5:  # At least 50% success
                         self.logger.info(f"✅ Alternative APIs success: {len(alt_data)}/{len(symbols)} symbols")
+                        self._store_market_data(symbols, alt_data)
                         return alt_data
             except Exception as e:
                 self.logger.warning(f"Alternative APIs failed: {e}")
@@ -95,6 +126,18 @@ class DataManager:
             self.logger.error(f"Error in get_market_data: {e}")
             return {}  # Return empty instead of any fake data
             
+    def _market_cache_key(self, symbols: List[str]) -> str:
+        """Cache key for a symbol list, independent of order."""
+        return f"market_data_{'-'.join(sorted(symbols))}"
+        
+    def _store_market_data(self, symbols: List[str], data: Dict):
+        """Remember live data for cached reads and the all-sources-failed fallback."""
+        self.cache[self._market_cache_key(symbols)] = {
+            'data': data,
+            'timestamp': datetime.utcnow(),
+            'symbols': symbols
+        }
+        
     async def _fetch_from_sources(self, symbols: List[str]) -> Dict:
         """Fetch data from multiple sources with intelligent prioritization."""
         
@@ -262,7 +305,7 @@ class DataManager:
             # Try Binance first for historical data
             from data_sources.binance_api import BinanceAPI
             
-            async with BinanceAPI() as binance:
+            async with BinanceAPI(session=self._shared_session()) as binance:
                 klines = await binance.get_klines(symbol, interval, limit)
                 
                 if klines:
@@ -276,24 +319,36 @@ class DataManager:
             return []
             
     async def test_all_sources(self) -> Dict[str, bool]:
-        """Test connectivity to all data sources."""
-        results = {}
+        """Test connectivity to all data sources concurrently."""
+        async def _test_binance() -> bool:
+            try:
+                from data_sources.binance_api import BinanceAPI
+                async with BinanceAPI(session=self._shared_session()) as binance:
+                    return await binance.test_connection()
+            except Exception:
+                return False
         
-        try:
-            from data_sources.binance_api import BinanceAPI
-            async with BinanceAPI() as binance:
-                results['binance'] = await binance.test_connection()
-        except Exception:
-            results['binance'] = False
-            
-        try:
-            from data_sources.coingecko_api import CoinGeckoAPI
-            async with CoinGeckoAPI() as coingecko:
-                results['coingecko'] = await coingecko.test_connection()
-        except Exception:
-            results['coingecko'] = False
-            
-        return results
+        async def _test_coingecko() -> bool:
+            try:
+                from data_sources.coingecko_api import CoinGeckoAPI
+                async with CoinGeckoAPI(session=self._shared_session()) as coingecko:
+                    return await coingecko.test_connection()
+            except Exception:
+                return False
+        
+        async with asyncio.TaskGroup() as tg:
+            binance_task = tg.create_task(_test_binance())
+            coingecko_task = tg.create_task(_test_coingecko())
+        return {'binance': binance_task.result(), 'coingecko': coingecko_task.result()}
+        
+    def invalidate(self, symbol: str):
+        """Drop cached entries that include symbol, leaving other symbols' data cached."""
+        # Cache keys look like "<prefix>_<SYM1>-<SYM2>-..."
+        stale_keys = [key for key in self.cache if symbol in key.rsplit('_', 1)[-1].split('-')]
+        for key in stale_keys:
+            self.cache.pop(key, None)
+        if stale_keys:
+            self.logger.info(f"Invalidated {len(stale_keys)} cache entries for {symbol}")
         
     def clear_cache(self):
         """Clear all cached data."""
@@ -302,8 +357,10 @@ class DataManager:
         
     def get_cache_stats(self) -> Dict:
         """Get cache statistics."""
-        total_entries = len(self.cache)
-        total_size = sum(len(str(entry)) for entry in self.cache.values())
+        # Snapshot first: this may run in a worker thread while the loop updates the cache
+        entries = list(self.cache.values())
+        total_entries = len(entries)
+        total_size = sum(len(str(entry)) for entry in entries)
         
         return {
             'total_entries': total_entries,
@@ -317,9 +374,7 @@ class DataManager:
         Returns the most recent valid data if available, otherwise None.
         """
         try:
-            # Sort symbols for consistent cache key
-            sorted_symbols = sorted(symbols)
-            cache_key = f"market_data_{'-'.join(sorted_symbols)}"
+            cache_key = self._market_cache_key(symbols)
             
             if cache_key in self.cache:
                 cached_time = self.cache[cache_key]['timestamp']
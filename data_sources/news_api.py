@@ -7,6 +7,7 @@ import asyncio
 import aiohttp
 import json
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
 import config
@@ -258,19 +259,13 @@ class NewsProcessor:
         else:
             overall_sentiment = 'neutral'
         
-        # Extract key themes
-        all_keywords = []
+        # Extract key themes: keyword frequency counted in one pass over the articles
+        keyword_count = Counter()
         for news in news_list:
-            all_keywords.extend(news.get('keywords', []))
+            keyword_count.update(news.get('keywords', []))
         
-        # Count keyword frequency
-        keyword_count = {}
-        for keyword in all_keywords:
-            keyword_count[keyword] = keyword_count.get(keyword, 0) + 1
-        
-        # Get top themes
-        key_themes = sorted(keyword_count.items(), key=lambda x: x[1], reverse=True)[:5]
-        key_themes = [theme[0] for theme in key_themes]
+        # Get top themes (ties keep first-seen order)
+        key_themes = [theme for theme, _ in keyword_count.most_common(5)]
         
         # Determine impact level
         high_impact_count = sum(1 for news in news_list if news.get('impact') == 'high')
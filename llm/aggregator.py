@@ -4,14 +4,49 @@ Enhanced with real AI integration, consensus building, and risk management.
 """
 
 import asyncio
+import functools
 import logging
 import json
+import os
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
 import config
 from llm.openai_client import OpenAIClient
 from llm.claude_client import ClaudeClient
+from llm.llm_cache import LLMCache
+
+# Prompt template text keyed by (path, mtime_ns); editing a template changes the key
+_PROMPT_CACHE: Dict[tuple, str] = {}
+
+
+def _read_prompt_template(path: str) -> Optional[str]:
+    """Return a prompt template's text, or None if it is missing; reads are cached until the file changes."""
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    text = _PROMPT_CACHE.get(key)
+    if text is None:
+        with open(path, 'r') as f:
+            text = f.read()
+        # Drop older versions of the same template
+        for stale in [k for k in _PROMPT_CACHE if k[0] == path]:
+            del _PROMPT_CACHE[stale]
+        _PROMPT_CACHE[key] = text
+    return text
+
+
+def _load_offline_fixture(path: str) -> Optional[Dict]:
+    """Return a saved analysis used in place of model calls in offline mode, or None if it is missing."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logging.getLogger(__name__).warning(f"Offline fixture {path} not found")
+    except ValueError as e:
+        logging.getLogger(__name__).warning(f"Offline fixture {path} is not valid JSON: {e}")
+    return None
 
 
 class AIAggregator:
@@ -20,6 +55,7 @@ class AIAggregator:
         self.openai_client = OpenAIClient()
         self.claude_client = ClaudeClient()
         self.confidence_threshold = 0.6  # Minimum confidence for signals
+        self.llm_cache = LLMCache() if config.LLM_CACHE_ENABLED else None
         
     # Utility Methods for Code Deduplication
     async def _execute_ai_task(self, model_name: str, task, timeout: int = None) -> Optional[Dict]:
@@ -49,24 +85,46 @@ class AIAggregator:
             models.append(('claude', self.claude_client))
         return models
     
-    async def _run_parallel_analysis(self, analysis_method: str, *args, timeout: int = None) -> Dict[str, Any]:
-        """Run analysis on all available models in parallel."""
+    async def _run_parallel_analysis(self, analysis_method: str, *args, timeout: int = None,
+                                     cache_args: tuple = None) -> Dict[str, Any]:
+        """Run analysis on all available models in parallel.
+        
+        With the LLM cache enabled, calls whose cache_args were answered before are served from it.
+        """
+        if config.LLM_OFFLINE:
+            self.logger.info(f"Offline mode: skipping {analysis_method} model calls")
+            return {}
+        
         models = self._get_available_models()
         if not models:
             self.logger.warning("No AI models available for analysis")
             return {}
         
+        use_cache = self.llm_cache is not None and cache_args is not None
+        results = {}
         tasks = []
         for model_name, client in models:
+            cache_key = None
+            if use_cache:
+                cache_key = LLMCache.make_key(analysis_method, model_name, *cache_args)
+                cached = await asyncio.to_thread(self.llm_cache.get, cache_key)
+                if cached:
+                    self.logger.info(f"{model_name} analysis served from LLM cache")
+                    results[model_name] = cached
+                    continue
             method = getattr(client, analysis_method)
             task = method(*args)
-            tasks.append((model_name, self._execute_ai_task(model_name, task, timeout)))
+            tasks.append((model_name, cache_key, self._execute_ai_task(model_name, task, timeout)))
         
-        results = {}
-        for model_name, task in tasks:
-            result = await task
+        # One request per model, all in flight together; _execute_ai_task never raises
+        async with asyncio.TaskGroup() as tg:
+            running = [(model_name, cache_key, tg.create_task(task)) for model_name, cache_key, task in tasks]
+        for model_name, cache_key, task in running:
+            result = task.result()
             if result:
                 results[model_name] = result
+                if cache_key is not None:
+                    await asyncio.to_thread(self.llm_cache.set, cache_key, result)
         
         return results
 
@@ -77,7 +135,10 @@ class AIAggregator:
             prompt_template = self.load_daily_prompt()
             
             # Run AI analyses in parallel for better performance
-            results = await self._run_parallel_analysis('analyze_market_data', market_data, prompt_template)
+            results = await self._run_parallel_analysis(
+                'analyze_market_data', market_data, prompt_template,
+                cache_args=(market_data, prompt_template)
+            )
             
             if not results:
                 self.logger.warning("All AI analyses failed, using fallback")
@@ -99,6 +160,9 @@ class AIAggregator:
 
     async def get_macro_sentiment_analysis(self, market_data: Dict, news_data: List = None, events_data: List = None) -> Optional[Dict]:
         """Get comprehensive macro and sentiment analysis from AI models."""
+        if config.LLM_OFFLINE:
+            return _load_offline_fixture(config.LLM_OFFLINE_MACRO_FIXTURE)
+        
         try:
             # Load macro sentiment prompt template
             prompt_template = self.load_macro_sentiment_prompt()
@@ -123,7 +187,11 @@ class AIAggregator:
             }
             
             # Run macro analyses in parallel
-            results = await self._run_parallel_analysis('analyze_macro_sentiment', enhanced_context, prompt_template)
+            # The cache key leaves out analysis_timestamp, which differs on every call
+            results = await self._run_parallel_analysis(
+                'analyze_macro_sentiment', enhanced_context, prompt_template,
+                cache_args=(market_data, news_data, events_data, prompt_template)
+            )
             
             if not results:
                 self.logger.warning("All AI models available for macro analysis failed")
@@ -170,22 +238,43 @@ class AIAggregator:
             self.logger.error(f"Pump analysis failed: {e}")
             return None
 
+    async def get_analyses_bulk(self, requests: List[Dict]) -> Dict[str, Optional[Dict]]:
+        """Run several analyses at once; each request is {'type': 'daily'|'macro'|'news'|'pump', 'data': arg or tuple of args}."""
+        handlers = {
+            'daily': self.get_daily_analysis,
+            'macro': self.get_macro_sentiment_analysis,
+            'news': self.get_news_sentiment_analysis,
+            'pump': self.analyze_pump_event,
+        }
+        
+        async def _dispatch(request: Dict) -> Optional[Dict]:
+            try:
+                data = request.get('data')
+                args = data if isinstance(data, tuple) else (data,)
+                return await handlers[request['type']](*args)
+            except Exception as e:
+                self.logger.error(f"Bulk {request.get('type')} analysis failed: {e}")
+                return None
+        
+        # Every analysis fans out to all models, so all their model calls are in flight together
+        async with asyncio.TaskGroup() as tg:
+            tasks = [(request.get('type'), tg.create_task(_dispatch(request))) for request in requests]
+        return {analysis_type: task.result() for analysis_type, task in tasks}
+
     def load_daily_prompt(self) -> str:
         """Load daily analysis prompt template."""
-        try:
-            with open('llm/prompt_templates/daily_prompt.md', 'r') as f:
-                return f.read()
-        except FileNotFoundError:
+        prompt = _read_prompt_template('llm/prompt_templates/daily_prompt.md')
+        if prompt is None:
             return self.get_default_daily_prompt()
+        return prompt
 
     def load_single_crypto_prompt(self) -> str:
         """Load single cryptocurrency analysis prompt template."""
-        try:
-            with open('llm/prompt_templates/single_crypto_prompt.md', 'r') as f:
-                return f.read()
-        except FileNotFoundError:
+        prompt = _read_prompt_template('llm/prompt_templates/single_crypto_prompt.md')
+        if prompt is None:
             self.logger.warning("Single crypto prompt not found, using default")
             return self.get_default_single_crypto_prompt()
+        return prompt
 
     def get_default_daily_prompt(self) -> str:
         """Default daily analysis prompt."""
@@ -241,12 +330,11 @@ Use professional Turkish financial terminology. Maximum 300 words. Base analysis
 
     def load_macro_sentiment_prompt(self) -> str:
         """Load macro sentiment analysis prompt template."""
-        try:
-            with open('llm/prompt_templates/macro_sentiment_prompt.md', 'r') as f:
-                return f.read()
-        except FileNotFoundError:
+        prompt = _read_prompt_template('llm/prompt_templates/macro_sentiment_prompt.md')
+        if prompt is None:
             self.logger.warning("Macro sentiment prompt not found, using default")
             return self.get_default_macro_prompt()
+        return prompt
             
     def get_default_macro_prompt(self) -> str:
         """Default macro sentiment prompt."""
@@ -838,7 +926,7 @@ Use professional Turkish financial terminology. Maximum 300 words. Base analysis
             evaluations = {}
             
             tasks = []
-            if self.openai_client.is_available():
+            if self.openai_client.is_available() and not config.LLM_OFFLINE:
                 for pump in pumps:
                     tasks.append((pump['symbol'], self.openai_client.analyze_pump_sustainability(pump)))
                     
@@ -860,22 +948,19 @@ Use professional Turkish financial terminology. Maximum 300 words. Base analysis
             return {}
             
     async def test_all_connections(self) -> Dict[str, bool]:
-        """Test connections to all AI services."""
-        results = {}
+        """Test connections to all AI services concurrently."""
+        async def _probe(client) -> bool:
+            try:
+                return await client.test_connection()
+            except Exception:
+                return False
         
-        try:
-            openai_test = await self.openai_client.test_connection()
-            results['openai'] = openai_test
-        except Exception:
-            results['openai'] = False
-            
-        try:
-            claude_test = await self.claude_client.test_connection()
-            results['claude'] = claude_test
-        except Exception:
-            results['claude'] = False
+        # Each probe reports its own failure, so one service going down never cancels the other
+        async with asyncio.TaskGroup() as tg:
+            openai_task = tg.create_task(_probe(self.openai_client))
+            claude_task = tg.create_task(_probe(self.claude_client))
             
-        return results 
+        return {'openai': openai_task.result(), 'claude': claude_task.result()}
 
     async def get_single_crypto_analysis(self, symbol: str, coin_data: Dict) -> Optional[str]:
         """Get AI analysis for a single cryptocurrency using professional template."""
@@ -906,6 +991,8 @@ ADDITIONAL CALCULATIONS:
             
             # Try both AI models
             analyses = []
+            if config.LLM_OFFLINE:
+                return self._generate_fallback_crypto_analysis(symbol, coin_data)
             
             if self.openai_client.is_available():
                 try:
@@ -1004,4 +1091,10 @@ Mevcut fiyat seviyesi ve hacim analizi göz önünde bulundurulduğunda, kısa v
 ⚠️ <b>Risk Seviyesi:</b> {risk_level}
 
 <i>Sistem analizi - yatırım tavsiyesi değildir.</i>
-        """.strip() 
\ No newline at end of file
+        """.strip()
+
+
+@functools.lru_cache(maxsize=1)
+def get_aggregator() -> AIAggregator:
+    """Return the process-wide AIAggregator; call get_aggregator.cache_clear() to rebuild it."""
+    return AIAggregator()
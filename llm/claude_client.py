@@ -4,11 +4,13 @@ Real API integration implemented.
 """
 
 import asyncio
+import functools
 import json
 import logging
 from typing import Dict, List, Optional
 
 import config
+from utils import loads as _json_loads
 
 try:
     import anthropic
@@ -17,6 +19,12 @@ except ImportError:
     CLAUDE_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=4)
+def _shared_sdk_client(api_key: str):
+    """One SDK client per API key, so every aggregator reuses the same keep-alive connection pool."""
+    return anthropic.Anthropic(api_key=api_key)
+
+
 class ClaudeClient:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -25,7 +33,7 @@ class ClaudeClient:
         self.max_retries = config.AI_MAX_RETRIES
         
         if self.is_available() and CLAUDE_AVAILABLE:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.client = _shared_sdk_client(self.api_key)
             self.logger.info("Claude client initialized successfully")
         else:
             self.client = None
@@ -84,7 +92,7 @@ Return ONLY a valid JSON response in this exact format:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     analysis['model'] = 'claude-3-real'
                     self.logger.info(f"Claude analysis completed successfully with {len(analysis.get('signals', []))} signals")
                     return analysis
@@ -157,7 +165,7 @@ Return ONLY a valid JSON response in this exact format:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     analysis['model'] = 'claude-3-real'
                     self.logger.info("Claude macro sentiment analysis completed successfully")
                     return analysis
@@ -219,7 +227,7 @@ Return ONLY a valid JSON response:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     self.logger.info("Claude risk factor analysis completed")
                     return analysis
                 except json.JSONDecodeError as e:
@@ -272,7 +280,7 @@ Return ONLY a valid JSON response:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     self.logger.info("Claude anomaly analysis completed")
                     return analysis
                 except json.JSONDecodeError as e:
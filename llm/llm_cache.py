@@ -0,0 +1,61 @@
+"""
+Exact-match response cache for AI model analyses.
+Stores per-model results in SQLite so repeated identical requests skip the API.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, Optional
+
+import config
+
+
+class LLMCache:
+    def __init__(self, path: str = None, ttl: float = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path or config.LLM_CACHE_FILE
+        self.ttl = config.LLM_CACHE_TTL if ttl is None else ttl
+
+    @staticmethod
+    def make_key(method: str, model: str, *args) -> str:
+        """Hash an analysis call (method, model and inputs) into a cache key."""
+        payload = json.dumps([method, model, args], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating it on first use."""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.path, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, created_at REAL, response TEXT)"
+        )
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response younger than the TTL (blocking, run off the event loop)."""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT created_at, response FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row and time.time() - row[0] < self.ttl:
+                return json.loads(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"LLM cache read failed: {e}")
+        return None
+
+    def set(self, key: str, response: Dict[str, Any]):
+        """Store a successful response (blocking, run off the event loop)."""
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, created_at, response) VALUES (?, ?, ?)",
+                    (key, time.time(), json.dumps(response, default=str))
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning(f"LLM cache write failed: {e}")
@@ -4,11 +4,13 @@ Real API integration implemented.
 """
 
 import asyncio
+import functools
 import json
 import logging
 from typing import Dict, List, Optional
 
 import config
+from utils import loads as _json_loads
 
 try:
     import openai
@@ -17,6 +19,12 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=4)
+def _shared_sdk_client(api_key: str):
+    """One SDK client per API key, so every aggregator reuses the same keep-alive connection pool."""
+    return openai.OpenAI(api_key=api_key)
+
+
 class OpenAIClient:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -26,7 +34,7 @@ class OpenAIClient:
         self.available = bool(self.api_key)
         
         if self.is_available() and OPENAI_AVAILABLE:
-            self.client = openai.OpenAI(api_key=self.api_key)
+            self.client = _shared_sdk_client(self.api_key)
             self.logger.info("OpenAI client initialized successfully")
         else:
             self.client = None
@@ -89,7 +97,7 @@ Return ONLY a valid JSON response in this exact format:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     self.logger.info(f"OpenAI analysis completed successfully with {len(analysis.get('signals', []))} signals")
                     return analysis
                 except json.JSONDecodeError as e:
@@ -165,7 +173,7 @@ Return ONLY a valid JSON response in this exact format:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     analysis['model'] = 'gpt-4-real'
                     self.logger.info("OpenAI macro sentiment analysis completed successfully")
                     return analysis
@@ -221,7 +229,7 @@ Return ONLY a valid JSON response:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     self.logger.info("OpenAI news sentiment analysis completed")
                     return analysis
                 except json.JSONDecodeError as e:
@@ -274,7 +282,7 @@ Return ONLY a valid JSON response:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     self.logger.info("OpenAI pump sustainability analysis completed")
                     return analysis
                 except json.JSONDecodeError as e:
@@ -331,7 +339,7 @@ Return ONLY a valid JSON response:
                     elif "```" in content:
                         content = content.split("```")[1].split("```")[0]
                     
-                    analysis = json.loads(content.strip())
+                    analysis = _json_loads(content.strip())
                     self.logger.info("OpenAI daily market overview completed")
                     return analysis
                 except json.JSONDecodeError as e:
@@ -17,7 +17,7 @@ import config
 from rules.rule_engine import RuleEngine
 from rules.risk_guard import RiskGuard
 from rules.stats_engine import StatsEngine
-from llm.aggregator import AIAggregator
+from llm.aggregator import get_aggregator
 from scheduler.time_trigger import TimeTrigger
 from pump_scanner.pump_detector import PumpDetector
 from binance_websocket_client import BinanceWebSocketClient
@@ -162,7 +162,7 @@ class CryptoAnalyzer:
         self.rule_engine = RuleEngine()
         self.risk_guard = RiskGuard()
         self.stats_engine = StatsEngine()
-        self.ai_aggregator = AIAggregator()
+        self.ai_aggregator = get_aggregator()
         self.time_trigger = TimeTrigger()
         self.pump_detector = PumpDetector()
         
@@ -176,6 +176,9 @@ class CryptoAnalyzer:
         # Telegram notifier with Turkish format
         self.telegram_notifier = EnhancedTelegramNotifier() if TELEGRAM_AVAILABLE else None
         
+        # Signal/analysis files are rewritten from worker threads; one writer at a time
+        self._data_file_lock = threading.Lock()
+        
         self.ensure_data_directory()
         self.load_existing_data()
         
@@ -290,8 +293,8 @@ class CryptoAnalyzer:
                 "_count": len(market_data)
             }
             
-            with open(prices_file, 'w') as f:
-                json.dump(market_data_with_timestamp, f, indent=2)
+            # Disk I/O runs in a worker thread; the Telegram bot shares this event loop
+            await asyncio.to_thread(self._write_json_file, prices_file, market_data_with_timestamp)
                 
         except Exception as e:
             self.logger.error(f"Error saving market data: {e}")
@@ -307,7 +310,7 @@ class CryptoAnalyzer:
             self.logger.info(f"Retrieved {len(news_data)} news articles")
             
             # Save news data
-            self.save_news_data(news_data)
+            await asyncio.to_thread(self.save_news_data, news_data)
             
             return news_data
             
@@ -316,27 +319,28 @@ class CryptoAnalyzer:
             return []
 
     def save_news_data(self, news_data: List[Dict]):
-        """Save news data to file."""
+        """Save news data to file (blocking, run off the event loop)."""
         try:
             news_file = f"{config.DATA_DIR}/news.json"
             
-            # Load existing news
-            existing_news = []
-            if os.path.exists(news_file):
-                with open(news_file, 'r') as f:
-                    existing_news = json.load(f)
-            
-            # Add new news (avoid duplicates by title)
-            existing_titles = {news.get('title', '') for news in existing_news}
-            new_articles = [news for news in news_data if news.get('title', '') not in existing_titles]
-            
-            # Combine and limit to last 100 articles
-            all_news = new_articles + existing_news
-            all_news = all_news[:100]
-            
-            # Save back to file
-            with open(news_file, 'w') as f:
-                json.dump(all_news, f, indent=2)
+            with self._data_file_lock:
+                # Load existing news
+                existing_news = []
+                if os.path.exists(news_file):
+                    with open(news_file, 'r') as f:
+                        existing_news = json.load(f)
+                
+                # Add new news (avoid duplicates by title)
+                existing_titles = {news.get('title', '') for news in existing_news}
+                new_articles = [news for news in news_data if news.get('title', '') not in existing_titles]
+                
+                # Combine and limit to last 100 articles
+                all_news = new_articles + existing_news
+                all_news = all_news[:100]
+                
+                # Save back to file
+                with open(news_file, 'w') as f:
+                    json.dump(all_news, f, indent=2)
                 
             if new_articles:
                 self.logger.info(f"Saved {len(new_articles)} new news articles")
@@ -436,11 +440,9 @@ class CryptoAnalyzer:
         final_signals = self.combine_signals(rule_signals, ai_signals)
         
         # Apply risk management
-        validated_signals = []
-        for signal in final_signals:
-            if self.risk_guard.validate_signal(signal):
-                validated_signals.append(signal)
-                self.save_signal(signal)
+        validated_signals = [signal for signal in final_signals if self.risk_guard.validate_signal(signal)]
+        # File I/O runs in a worker thread so the bot sharing this loop stays responsive
+        await asyncio.to_thread(self.save_signals, validated_signals)
         
         if validated_signals:
             self.logger.info(f"✅ Daily analysis complete with LIVE data. Generated {len(validated_signals)} validated signals")
@@ -653,7 +655,7 @@ class CryptoAnalyzer:
                     enhanced_signal['macro_factors'] = macro_analysis.get('macro_factors', {})
                     enhanced_signal['risk_assessment'] = macro_analysis.get('risk_assessment', {})
                     
-                    self.save_signal(enhanced_signal)
+                    await asyncio.to_thread(self.save_signal, enhanced_signal)
                     
                     # Send signal to Telegram
                     if TELEGRAM_AVAILABLE:
@@ -675,7 +677,7 @@ class CryptoAnalyzer:
             self.logger.info(f"  - News Articles Analyzed: {len(news_data) if news_data else 0}")
             
             # Save macro analysis results
-            self.save_macro_analysis(macro_analysis)
+            await asyncio.to_thread(self.save_macro_analysis, macro_analysis)
             
             # Send macro analysis to Telegram
             if TELEGRAM_AVAILABLE:
@@ -722,7 +724,7 @@ class CryptoAnalyzer:
                 self.logger.info(f"  - Articles Processed: {len(news_data)}")
                 
                 # Store news analysis for next consolidated update (don't send separate notification)
-                self._store_news_analysis(news_analysis, news_data)
+                await asyncio.to_thread(self._store_news_analysis, news_analysis, news_data)
                 
                 # Trigger macro analysis if high-impact news
                 if impact.lower() in ['high', 'medium'] and sentiment in ['bullish', 'bearish']:
@@ -733,7 +735,7 @@ class CryptoAnalyzer:
             self.logger.error(f"News analysis failed: {e}")
             
     def _store_news_analysis(self, analysis: Dict, news_data: List):
-        """Store news analysis for inclusion in consolidated updates."""
+        """Store news analysis for inclusion in consolidated updates (blocking, run off the event loop)."""
         try:
             news_summary = {
                 'analysis': analysis,
@@ -744,8 +746,7 @@ class CryptoAnalyzer:
             
             # Store in data directory for consolidated updates
             news_summary_file = f"{config.DATA_DIR}/latest_news_summary.json"
-            with open(news_summary_file, 'w') as f:
-                json.dump(news_summary, f, indent=2)
+            self._write_json_file(news_summary_file, news_summary)
                 
         except Exception as e:
             self.logger.error(f"Error storing news analysis: {e}")
@@ -786,7 +787,7 @@ class CryptoAnalyzer:
                                 for signal in signals:
                                     if self.risk_guard.validate_signal(signal):
                                         signal['anomaly_trigger'] = anomaly
-                                        self.save_signal(signal)
+                                        await asyncio.to_thread(self.save_signal, signal)
                         except Exception as e:
                             self.logger.warning(f"AI analysis for anomaly failed: {e}")
                         
@@ -890,25 +891,38 @@ class CryptoAnalyzer:
                 
         return combined_signal
 
+    def _write_json_file(self, path: str, data):
+        """Write one JSON data file (blocking, run off the event loop)."""
+        with self._data_file_lock:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+
     def save_signal(self, signal: Dict):
         """Save signal to persistent storage."""
+        self.save_signals([signal])
+
+    def save_signals(self, new_signals: List[Dict]):
+        """Append signals to persistent storage with one read and one write (blocking, run off the event loop)."""
+        if not new_signals:
+            return
         try:
-            # Load existing signals
-            signals = []
-            if os.path.exists(config.SIGNALS_FILE):
-                with open(config.SIGNALS_FILE, 'r') as f:
-                    signals = json.load(f)
-                    
-            # Add new signal
-            signals.append(signal)
-            
-            # Keep only the last 100 signals
-            if len(signals) > 100:
-                signals = signals[-100:]
+            with self._data_file_lock:
+                # Load existing signals
+                signals = []
+                if os.path.exists(config.SIGNALS_FILE):
+                    with open(config.SIGNALS_FILE, 'r') as f:
+                        signals = json.load(f)
+                        
+                # Add new signals
+                signals.extend(new_signals)
                 
-            # Save back to file
-            with open(config.SIGNALS_FILE, 'w') as f:
-                json.dump(signals, f, indent=2)
+                # Keep only the last 100 signals
+                if len(signals) > 100:
+                    signals = signals[-100:]
+                    
+                # Save back to file
+                with open(config.SIGNALS_FILE, 'w') as f:
+                    json.dump(signals, f, indent=2)
                 
         except Exception as e:
             self.logger.error(f"Error saving signal: {e}")
@@ -918,22 +932,23 @@ class CryptoAnalyzer:
         try:
             macro_file = f"{config.DATA_DIR}/macro_analysis.json"
             
-            # Load existing analyses
-            analyses = []
-            if os.path.exists(macro_file):
-                with open(macro_file, 'r') as f:
-                    analyses = json.load(f)
-            
-            # Add new analysis
-            analyses.append(analysis)
-            
-            # Keep only the last 50 analyses
-            if len(analyses) > 50:
-                analyses = analyses[-50:]
-            
-            # Save back to file
-            with open(macro_file, 'w') as f:
-                json.dump(analyses, f, indent=2)
+            with self._data_file_lock:
+                # Load existing analyses
+                analyses = []
+                if os.path.exists(macro_file):
+                    with open(macro_file, 'r') as f:
+                        analyses = json.load(f)
+                
+                # Add new analysis
+                analyses.append(analysis)
+                
+                # Keep only the last 50 analyses
+                if len(analyses) > 50:
+                    analyses = analyses[-50:]
+                
+                # Save back to file
+                with open(macro_file, 'w') as f:
+                    json.dump(analyses, f, indent=2)
                 
         except Exception as e:
             self.logger.error(f"Error saving macro analysis: {e}")
@@ -943,6 +958,10 @@ class CryptoAnalyzer:
         self.running = True
         self.logger.info("🚀 Starting Enhanced Scheduler with LIVE data and consolidated notifications")
         
+        # The bot polls on the scheduler's loop instead of a private thread
+        if self.telegram_notifier:
+            await self.telegram_notifier.start_async()
+        
         # Send startup notification
         if TELEGRAM_AVAILABLE:
             try:
@@ -1014,6 +1033,9 @@ class CryptoAnalyzer:
         self.logger.info("Shutting down crypto analyzer...")
         self.running = False
         
+        if self.telegram_notifier:
+            await self.telegram_notifier.stop_async()
+        
         if self.websocket_client:
             try:
                 await self.websocket_client.disconnect()
@@ -1125,8 +1147,7 @@ class CryptoAnalyzer:
             
             # Add AI analysis if available
             try:
-                from llm.aggregator import AIAggregator
-                aggregator = AIAggregator()
+                aggregator = get_aggregator()
                 analysis = await aggregator.analyze_single_crypto(symbol, data)
                 
                 if analysis and 'signals' in analysis:
@@ -3,17 +3,17 @@
 Real-time monitoring script for crypto trading signals.
 """
 
-import json
 import time
 import os
 from datetime import datetime
+from utils import loads as _json_loads
 
 
 def load_signals():
     """Load latest signals from file."""
     try:
-        with open('data/signals.json', 'r') as f:
-            return json.load(f)
+        with open('data/signals.json', 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         return []
 
@@ -21,8 +21,8 @@ def load_signals():
 def load_prices():
     """Load latest price data."""
     try:
-        with open('data/prices.json', 'r') as f:
-            return json.load(f)
+        with open('data/prices.json', 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         return {}
 
@@ -9,6 +9,7 @@ import os
 import threading
 from datetime import datetime
 from binance_websocket_client import BinanceWebSocketClient
+from utils import loads as _json_loads
 
 
 class EnhancedCryptoMonitor:
@@ -20,16 +21,16 @@ class EnhancedCryptoMonitor:
     def load_signals(self):
         """Load latest signals from file."""
         try:
-            with open('data/signals.json', 'r') as f:
-                return json.load(f)
+            with open('data/signals.json', 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             return []
 
     def load_prices(self):
         """Load latest price data."""
         try:
-            with open('data/prices.json', 'r') as f:
-                return json.load(f)
+            with open('data/prices.json', 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             return {}
 
@@ -204,7 +205,8 @@ class EnhancedCryptoMonitor:
         
         # Start WebSocket client
         self.start_websocket_client()
-        time.sleep(2)  # Give it time to connect
+        # Continue as soon as the socket opens, waiting at most 2s as before
+        self.websocket_client.wait_until_connected(timeout=2)
         
         last_signal_count = 0
         
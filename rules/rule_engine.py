@@ -5,9 +5,10 @@ Provides fallback logic when AI is unavailable.
 
 import json
 import logging
-import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 import config
 
@@ -17,7 +18,7 @@ class RuleEngine:
         self.logger = logging.getLogger(__name__)
         self.price_history = {}
         
-    def calculate_rsi(self, prices: List[float], period: int = None) -> float:
+    def calculate_rsi(self, prices: Sequence[float], period: int = None) -> float:
         """Calculate RSI (Relative Strength Index)."""
         if period is None:
             period = config.RSI_PERIOD
@@ -25,13 +26,11 @@ class RuleEngine:
         if len(prices) < period + 1:
             return 50.0  # Neutral RSI if insufficient data
             
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        
-        gains = [delta if delta > 0 else 0 for delta in deltas]
-        losses = [-delta if delta < 0 else 0 for delta in deltas]
+        # Only the last `period` price changes contribute to the averages
+        deltas = np.diff(np.asarray(prices, dtype=np.float64)[-(period + 1):])
         
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
+        avg_gain = float(deltas[deltas > 0].sum()) / period
+        avg_loss = float(-deltas[deltas < 0].sum()) / period
         
         if avg_loss == 0:
             return 100.0
@@ -41,7 +40,7 @@ class RuleEngine:
         
         return rsi
         
-    def calculate_macd(self, prices: List[float]) -> Dict[str, float]:
+    def calculate_macd(self, prices: Sequence[float]) -> Dict[str, float]:
         """Calculate MACD (Moving Average Convergence Divergence)."""
         if len(prices) < config.MACD_SLOW + config.MACD_SIGNAL:
             return {'macd': 0, 'signal': 0, 'histogram': 0}
@@ -64,30 +63,32 @@ class RuleEngine:
             'histogram': histogram
         }
         
-    def calculate_ema(self, prices: List[float], period: int) -> float:
+    def calculate_ema(self, prices: Sequence[float], period: int) -> float:
         """Calculate Exponential Moving Average."""
+        prices = np.asarray(prices, dtype=np.float64)
         if len(prices) < period:
-            return sum(prices) / len(prices) if prices else 0
+            return float(prices.mean()) if len(prices) else 0
             
         multiplier = 2 / (period + 1)
-        ema = sum(prices[:period]) / period  # Start with SMA
+        ema = prices[:period].mean()  # Start with SMA
         
-        for price in prices[period:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
-            
-        return ema
+        # Closed form of ema = price * m + ema * (1 - m) applied over the remaining prices
+        rest = prices[period:]
+        decay = (1 - multiplier) ** np.arange(len(rest) - 1, -1, -1)
+        return float(ema * (1 - multiplier) ** len(rest) + multiplier * np.dot(decay, rest))
         
-    def calculate_bollinger_bands(self, prices: List[float], period: int = 20, std_dev: int = 2) -> Dict[str, float]:
+    def calculate_bollinger_bands(self, prices: Sequence[float], period: int = 20, std_dev: int = 2) -> Dict[str, float]:
         """Calculate Bollinger Bands."""
+        prices = np.asarray(prices, dtype=np.float64)
         if len(prices) < period:
-            avg_price = sum(prices) / len(prices) if prices else 0
+            avg_price = float(prices.mean()) if len(prices) else 0
             return {'upper': avg_price, 'middle': avg_price, 'lower': avg_price}
             
         recent_prices = prices[-period:]
-        sma = sum(recent_prices) / period
+        sma = float(recent_prices.mean())
         
-        variance = sum((price - sma) ** 2 for price in recent_prices) / period
-        std_deviation = math.sqrt(variance)
+        # Population standard deviation, as before
+        std_deviation = float(recent_prices.std())
         
         upper_band = sma + (std_deviation * std_dev)
         lower_band = sma - (std_deviation * std_dev)
@@ -130,7 +131,9 @@ class RuleEngine:
                 self.logger.warning(f"Insufficient historical data for {symbol} ({len(prices)} prices)")
                 return None
                 
-            current_price = prices[-1]
+            # One float64 array feeds all indicators
+            prices = np.asarray(prices, dtype=np.float64)
+            current_price = float(prices[-1])
             
             # Calculate technical indicators
             rsi = self.calculate_rsi(prices)
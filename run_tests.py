@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Runs the macro sentiment, news API and system test scripts together on one event loop.
+With --telegram, the Telegram test scripts (which send real messages) run on it as well.
+Each script still works standalone through its own __main__ block.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import test_macro_sentiment
+import test_news_api
+import test_system
+import test_telegram
+import test_turkish_signals
+from testing_utils import flush_report_loggers, install_event_loop_policy
+
+
+async def main(include_telegram: bool = False):
+    """Run the test entrypoints concurrently; one crashing does not stop the others."""
+    entrypoints = [
+        ("Macro Sentiment", test_macro_sentiment.main),
+        ("News API", test_news_api.test_news_api),
+        ("System", test_system.main),
+    ]
+    if include_telegram:
+        # Same loop as the others, so the shared notifier keeps its HTTP session across scripts
+        entrypoints += [
+            ("Telegram", test_telegram.test_telegram_bot),
+            ("Turkish Signals", test_turkish_signals.test_turkish_signals),
+        ]
+    
+    results = await asyncio.gather(*(entry() for _, entry in entrypoints), return_exceptions=True)
+    for (name, _), result in zip(entrypoints, results):
+        if isinstance(result, Exception):
+            print(f"❌ {name} tests crashed: {result}")
+
+
+if __name__ == "__main__":
+    install_event_loop_policy()
+    try:
+        asyncio.run(main(include_telegram='--telegram' in sys.argv[1:]))
+    finally:
+        flush_report_loggers()
@@ -12,6 +12,7 @@ from .telegram_bot import (
     send_daily_summary,
     send_error,
     send_startup,
+    flush_notifications,
     test_telegram
 )
 
@@ -25,5 +26,6 @@ __all__ = [
     'send_daily_summary',
     'send_error',
     'send_startup',
+    'flush_notifications',
     'test_telegram'
 ] 
\ No newline at end of file
@@ -75,8 +75,8 @@ async def test_telegram_live_signals():
     print("\n📱 Testing Telegram LIVE Signals...")
     
     try:
-        from telegram_bot_module.telegram_bot import EnhancedTelegramNotifier
-        telegram_bot = EnhancedTelegramNotifier()
+        from telegram_bot_module.telegram_bot import telegram_notifier
+        telegram_bot = telegram_notifier  # Shared module-level notifier
         
         if not telegram_bot.enabled:
             print("⚠️ Telegram bot not enabled (missing config)")
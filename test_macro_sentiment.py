@@ -4,19 +4,33 @@ Demonstrates how the enhanced AI prompting system works.
 """
 
 import asyncio
+import functools
 import json
 import logging
 from datetime import datetime
 from typing import Dict, List
 
-from llm.aggregator import AIAggregator
+from llm.aggregator import AIAggregator, get_aggregator
+
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
 
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default for the tests' result argument: run the analysis (None is a valid "no result" outcome)
+_NOT_RUN = object()
+
 
+@functools.lru_cache(maxsize=1)
 def get_sample_market_data() -> Dict:
     """Generate sample market data for testing."""
     return {
@@ -53,6 +67,7 @@ def get_sample_market_data() -> Dict:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_sample_news_data() -> List[Dict]:
     """Generate sample news data for testing."""
     return [
@@ -83,6 +98,7 @@ def get_sample_news_data() -> List[Dict]:
     ]
 
 
+@functools.lru_cache(maxsize=1)
 def get_sample_events_data() -> List[Dict]:
     """Generate sample crypto events data for testing."""
     return [
@@ -107,15 +123,14 @@ def get_sample_events_data() -> List[Dict]:
     ]
 
 
-async def test_basic_analysis():
-    """Test basic AI aggregator functionality."""
+async def test_basic_analysis(aggregator: AIAggregator = None, result: Dict = _NOT_RUN) -> Dict:
+    """Test basic AI aggregator functionality; runs the analysis unless a result is given."""
     logger.info("=== Testing Basic Daily Analysis ===")
     
-    aggregator = AIAggregator()
-    market_data = get_sample_market_data()
-    
     try:
-        result = await aggregator.get_daily_analysis(market_data)
+        if result is _NOT_RUN:
+            aggregator = aggregator or get_aggregator()
+            result = await aggregator.get_daily_analysis(get_sample_market_data())
         
         if result:
             logger.info("✅ Basic analysis completed successfully")
@@ -132,21 +147,20 @@ async def test_basic_analysis():
             
     except Exception as e:
         logger.error(f"❌ Basic analysis failed: {e}")
+    
+    return result
 
 
-async def test_macro_sentiment_analysis():
-    """Test the new macro sentiment analysis functionality."""
+async def test_macro_sentiment_analysis(aggregator: AIAggregator = None, result: Dict = _NOT_RUN) -> Dict:
+    """Test the new macro sentiment analysis functionality; runs the analysis unless a result is given."""
     logger.info("\n=== Testing Macro Sentiment Analysis ===")
     
-    aggregator = AIAggregator()
-    market_data = get_sample_market_data()
-    news_data = get_sample_news_data()
-    events_data = get_sample_events_data()
-    
     try:
-        result = await aggregator.get_macro_sentiment_analysis(
-            market_data, news_data, events_data
-        )
+        if result is _NOT_RUN:
+            aggregator = aggregator or get_aggregator()
+            result = await aggregator.get_macro_sentiment_analysis(
+                get_sample_market_data(), get_sample_news_data(), get_sample_events_data()
+            )
         
         if result:
             logger.info("✅ Macro sentiment analysis completed successfully")
@@ -200,13 +214,15 @@ async def test_macro_sentiment_analysis():
             
     except Exception as e:
         logger.error(f"❌ Macro sentiment analysis failed: {e}")
+    
+    return result
 
 
-async def test_prompt_loading():
+async def test_prompt_loading(aggregator: AIAggregator = None):
     """Test prompt template loading."""
     logger.info("\n=== Testing Prompt Template Loading ===")
     
-    aggregator = AIAggregator()
+    aggregator = aggregator or get_aggregator()
     
     try:
         # Test daily prompt loading
@@ -225,11 +241,11 @@ async def test_prompt_loading():
         logger.error(f"❌ Prompt loading failed: {e}")
 
 
-async def test_aggregation_logic():
+async def test_aggregation_logic(aggregator: AIAggregator = None):
     """Test the aggregation logic with mock data."""
     logger.info("\n=== Testing Aggregation Logic ===")
     
-    aggregator = AIAggregator()
+    aggregator = aggregator or get_aggregator()
     
     # Mock results from different models
     mock_results = {
@@ -310,8 +326,8 @@ def save_sample_output(analysis_result: Dict):
     """Save a sample analysis result for reference."""
     if analysis_result:
         try:
-            with open('sample_macro_analysis.json', 'w') as f:
-                json.dump(analysis_result, f, indent=2)
+            with open('sample_macro_analysis.json', 'wb') as f:
+                f.write(_dump_json(analysis_result))
             logger.info("✅ Sample output saved to 'sample_macro_analysis.json'")
         except Exception as e:
             logger.error(f"❌ Failed to save sample output: {e}")
@@ -322,35 +338,25 @@ async def main():
     logger.info("🚀 Starting Macro Sentiment Analysis Tests")
     logger.info("=" * 60)
     
+    # One aggregator (and its client connections) is shared by every test
+    aggregator = get_aggregator()
+    
     # Test prompt loading first
-    await test_prompt_loading()
+    await test_prompt_loading(aggregator)
     
     # Test aggregation logic
-    await test_aggregation_logic()
+    await test_aggregation_logic(aggregator)
     
-    # Test basic functionality
-    await test_basic_analysis()
-    
-    # Test main macro sentiment functionality
-    result = None
-    try:
-        aggregator = AIAggregator()
-        market_data = get_sample_market_data()
-        news_data = get_sample_news_data()
-        events_data = get_sample_events_data()
-        
-        result = await aggregator.get_macro_sentiment_analysis(
-            market_data, news_data, events_data
-        )
-        
-        if result:
-            save_sample_output(result)
-            
-    except Exception as e:
-        logger.error(f"Main test failed: {e}")
-    
-    # Test the full macro sentiment analysis
-    await test_macro_sentiment_analysis()
+    # The API-backed analyses are independent, so they go out as one bulk dispatch;
+    # the macro analysis runs once and its result is also saved as the sample output
+    market_data = get_sample_market_data()
+    results = await aggregator.get_analyses_bulk([
+        {'type': 'daily', 'data': market_data},
+        {'type': 'macro', 'data': (market_data, get_sample_news_data(), get_sample_events_data())},
+    ])
+    await test_basic_analysis(aggregator, results['daily'])
+    result = await test_macro_sentiment_analysis(aggregator, results['macro'])
+    save_sample_output(result)
     
     logger.info("=" * 60)
     logger.info("🎯 Tests completed!")
@@ -6,57 +6,64 @@ import asyncio
 import json
 import logging
 from data_sources.news_api import get_crypto_news, NewsProcessor
+from testing_utils import make_report_logger
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+report, _report_handler = make_report_logger(__name__)
+
 async def test_news_api():
     """Test the crypto news API."""
-    print("🚀 Testing Crypto News API...")
-    print("=" * 50)
+    report.info("🚀 Testing Crypto News API...")
+    report.info("=" * 50)
     
     try:
         # Get crypto news
-        print("📰 Fetching crypto news...")
+        report.info("📰 Fetching crypto news...")
         news_articles = await get_crypto_news(limit=5)
         
-        print(f"✅ Successfully fetched {len(news_articles)} news articles!")
-        print()
+        report.info(f"✅ Successfully fetched {len(news_articles)} news articles!")
+        report.info("")
         
         if news_articles:
-            print("📋 Latest Crypto News:")
-            print("-" * 40)
+            report.info("📋 Latest Crypto News:")
+            report.info("-" * 40)
             
             for i, article in enumerate(news_articles[:3], 1):
-                print(f"{i}. 📰 {article['title']}")
-                print(f"   🏷️  Source: {article['source']}")
-                print(f"   📊 Sentiment: {article['sentiment']} | Impact: {article['impact']}")
-                print(f"   🔗 {article['url']}")
+                report.info(f"{i}. 📰 {article['title']}")
+                report.info(f"   🏷️  Source: {article['source']}")
+                report.info(f"   📊 Sentiment: {article['sentiment']} | Impact: {article['impact']}")
+                report.info(f"   🔗 {article['url']}")
                 if article.get('keywords'):
-                    print(f"   🏷️  Keywords: {', '.join(article['keywords'][:3])}")
-                print()
+                    report.info(f"   🏷️  Keywords: {', '.join(article['keywords'][:3])}")
+                report.info("")
             
             # Test news processing
-            print("🧠 Processing news for AI analysis...")
+            report.info("🧠 Processing news for AI analysis...")
             processor = NewsProcessor()
+            # The fetched list is processed as-is; nothing is downloaded again
             processed = processor.process_news_for_ai(news_articles)
+            if processed['total_articles'] != len(news_articles):
+                report.error(f"❌ Processed {processed['total_articles']} of {len(news_articles)} articles")
             
-            print("📊 News Analysis Results:")
-            print(f"   📈 Overall Sentiment: {processed['sentiment_summary']}")
-            print(f"   ⚡ Impact Level: {processed['impact_level']}")
-            print(f"   🎯 Key Themes: {', '.join(processed['key_themes'][:5])}")
-            print(f"   📰 Total Articles: {processed['total_articles']}")
-            print(f"   📡 Sources: {', '.join(processed['sources'])}")
+            report.info("📊 News Analysis Results:")
+            report.info(f"   📈 Overall Sentiment: {processed['sentiment_summary']}")
+            report.info(f"   ⚡ Impact Level: {processed['impact_level']}")
+            report.info(f"   🎯 Key Themes: {', '.join(processed['key_themes'][:5])}")
+            report.info(f"   📰 Total Articles: {processed['total_articles']}")
+            report.info(f"   📡 Sources: {', '.join(processed['sources'])}")
             
         else:
-            print("❌ No news articles fetched")
+            report.info("❌ No news articles fetched")
             
     except Exception as e:
-        print(f"❌ Error testing news API: {e}")
+        report.info(f"❌ Error testing news API: {e}")
         
-    print("\n" + "=" * 50)
-    print("🎯 News API test completed!")
+    report.info("\n" + "=" * 50)
+    report.info("🎯 News API test completed!")
+    _report_handler.flush()
 
 if __name__ == "__main__":
     asyncio.run(test_news_api()) 
\ No newline at end of file
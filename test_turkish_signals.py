@@ -11,8 +11,11 @@ import os
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from telegram_bot_module.telegram_bot import EnhancedTelegramNotifier
+from telegram_bot_module.telegram_bot import telegram_notifier
 import config
+from testing_utils import install_event_loop_policy, make_report_logger
+
+report, _report_handler = make_report_logger(__name__)
 
 async def test_turkish_signals():
     """Test Turkish signals generation."""
@@ -23,40 +26,41 @@ async def test_turkish_signals():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    print("🇹🇷 Türkçe Sinyal Formatı Test Ediliyor...")
-    print("=" * 50)
+    report.info("🇹🇷 Türkçe Sinyal Formatı Test Ediliyor...")
+    report.info("=" * 50)
     
     try:
         # Initialize telegram notifier
-        telegram_bot = EnhancedTelegramNotifier()
+        telegram_bot = telegram_notifier  # Shared module-level notifier
         
         # Test Turkish signals generation
-        print("📊 Gerçek verilerle sinyal oluşturuluyor...")
+        report.info("📊 Gerçek verilerle sinyal oluşturuluyor...")
         
         turkish_signals = await telegram_bot.get_turkish_signals()
         
-        print("\n" + "="*50)
-        print("🎯 OLUŞTURULAN SİNYALLER:")
-        print("="*50)
-        print(turkish_signals)
-        print("="*50)
+        report.info("\n" + "="*50)
+        report.info("🎯 OLUŞTURULAN SİNYALLER:")
+        report.info("="*50)
+        report.info(turkish_signals)
+        report.info("="*50)
         
         # If telegram is configured, send the signal
         if config.TELEGRAM_ENABLED and config.TELEGRAM_CHAT_ID:
-            print("\n📤 Telegram'a gönderiliyor...")
+            report.info("\n📤 Telegram'a gönderiliyor...")
             success = await telegram_bot.send_message(turkish_signals)
             if success:
-                print("✅ Telegram gönderimi başarılı!")
+                report.info("✅ Telegram gönderimi başarılı!")
             else:
-                print("❌ Telegram gönderimi başarısız!")
+                report.info("❌ Telegram gönderimi başarısız!")
         else:
-            print("📱 Telegram yapılandırılmamış - sadece yerel test")
+            report.info("📱 Telegram yapılandırılmamış - sadece yerel test")
             
     except Exception as e:
-        print(f"❌ Test hatası: {e}")
-        import traceback
-        traceback.print_exc()
+        report.error(f"❌ Test hatası: {e}", exc_info=True)
+    
+    _report_handler.flush()
 
 if __name__ == "__main__":
-    print("🚀 Crypto AI Analyzer - Türkçe Sinyal Test")
+    report.info("🚀 Crypto AI Analyzer - Türkçe Sinyal Test")
+    install_event_loop_policy()
     asyncio.run(test_turkish_signals()) 
\ No newline at end of file
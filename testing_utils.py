@@ -0,0 +1,46 @@
+"""
+Shared helpers for the standalone test scripts.
+"""
+
+import asyncio
+import logging
+import logging.handlers
+import sys
+from typing import List, Tuple
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Optional: the stdlib event loop is used when uvloop is not installed
+
+# Every report handler created, so a runner can flush them all on exit
+_REPORT_HANDLERS: List[logging.handlers.MemoryHandler] = []
+
+
+def make_report_logger(name: str) -> Tuple[logging.Logger, logging.handlers.MemoryHandler]:
+    """Return a report logger and its handler; lines are buffered and written to stdout in bulk, errors flush right away."""
+    report = logging.getLogger(f"{name}.report")
+    for handler in report.handlers:
+        if handler in _REPORT_HANDLERS:
+            return report, handler
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=stream)
+    report.setLevel(logging.INFO)
+    report.addHandler(handler)
+    report.propagate = False
+    _REPORT_HANDLERS.append(handler)
+    return report, handler
+
+
+def flush_report_loggers():
+    """Write out whatever every report logger still has buffered."""
+    for handler in _REPORT_HANDLERS:
+        handler.flush()
+
+
+def install_event_loop_policy():
+    """Run the scripts' event loops on uvloop when it is installed."""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
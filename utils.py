@@ -0,0 +1,24 @@
+"""
+Shared JSON helpers: orjson when it is installed, the standard json module otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: much faster on large payloads and data files
+
+
+def loads(data):
+    """Decode JSON from str or bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')